@@ -2,28 +2,81 @@
 Agent configuration loader for the GRC Agent Squad.
 
 This module provides functionality to load and manage agent configurations
-from individual YAML files with JSON schema validation.
+from individual YAML or JSON files with JSON schema validation.
 """
 
+import copy
+import hashlib
 import json
 import os
+import re
 import structlog
-from typing import Any, Dict, List, Optional
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+import orjson
 import yaml
 
 try:
-    from jsonschema import ValidationError, validate
+    # libyaml-backed loader, much faster than the pure-Python SafeLoader
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+try:
+    from jsonschema import Draft7Validator, ValidationError
+    from jsonschema.exceptions import best_match
+    from jsonschema.validators import validator_for
     HAS_JSONSCHEMA = True
 except ImportError:
     HAS_JSONSCHEMA = False
     ValidationError = Exception
 
+try:
+    # Code-generates a validation function per schema, much faster than jsonschema
+    import fastjsonschema
+    HAS_FASTJSONSCHEMA = True
+except ImportError:
+    HAS_FASTJSONSCHEMA = False
+
 from src.utils.settings import settings
 
 
+# Parsed config documents keyed by absolute path, stored with the (mtime_ns, size)
+# stamp they were parsed at so unchanged files are never re-tokenized
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+# Agent files are loaded on a thread pool only when more than this many are pending.
+# Parsing and validation mostly hold the GIL, so for the handful of default agents
+# the pool costs more than it saves; it only pays off once file I/O dominates.
+_PARALLEL_LOAD_THRESHOLD = 16
+_MAX_LOAD_WORKERS = 8
+
+# Accepted agent file extensions in order of preference; JSON parses much faster than YAML
+_AGENT_FILE_EXTENSIONS = ('.json', '.yaml', '.yml')
+
+
+def _load_config_file(path: str) -> Any:
+    """Load a JSON or YAML file, reusing the cached parse while the file is unchanged."""
+    abs_path = os.path.abspath(path)
+    stat = os.stat(abs_path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    
+    cached = _CONFIG_CACHE.get(abs_path)
+    if cached is None or cached[0] != stamp:
+        with open(abs_path, 'r', encoding='utf-8') as f:
+            if abs_path.endswith('.json'):
+                data = json.load(f)
+            else:
+                data = yaml.load(f, Loader=YamlLoader)
+        cached = _CONFIG_CACHE[abs_path] = (stamp, data)
+    
+    return copy.deepcopy(cached[1])
+
+
 class AgentConfigLoader:
-    """Loads and manages agent configurations from individual YAML files with schema validation."""
+    """Loads and manages agent configurations from individual YAML or JSON files with schema validation."""
     
     def __init__(self, config_directory: Optional[str] = None, active_agents: Optional[List[str]] = None):
         """
@@ -38,8 +91,15 @@ class AgentConfigLoader:
         self.config_directory = config_directory or settings.agent_config_directory
         self.active_agents = active_agents or settings.active_agents_list
         self.individual_schema_path = self._get_individual_schema_path()
+        self._agent_paths: Dict[str, str] = {}
         self._agent_configs: Dict[str, 'FileBasedAgentConfig'] = {}
+        self._failed_agents: Set[str] = set()
         self._individual_schema: Optional[Dict[str, Any]] = None
+        self._schema_validator: Optional[Any] = None
+        self._compiled_validator: Optional[Any] = None
+        self._schema_digest = b""
+        self._schema_error: Optional[str] = None
+        self._cache_directory = self._get_cache_directory()
         self._communication_formats: Dict[str, str] = {}
         self._use_cases: Dict[str, Dict[str, Any]] = {}
         
@@ -53,6 +113,18 @@ class AgentConfigLoader:
         config_dir = os.path.dirname(self.config_directory)
         return os.path.join(config_dir, "agent-schema.json")
     
+    def _get_cache_directory(self) -> Optional[str]:
+        """Get the directory for cached validated agent configs, if caching is enabled."""
+        # Files are edited constantly during development, so skip the on-disk cache there
+        if not settings.agent_config_cache_dir or settings.development_mode:
+            return None
+        
+        cache_dir = settings.agent_config_cache_dir
+        if not os.path.isabs(cache_dir):
+            project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+            cache_dir = os.path.join(project_root, cache_dir)
+        return cache_dir
+    
     def _load_communication_formats(self) -> None:
         """Load common communication format instructions from YAML file."""
         try:
@@ -62,8 +134,7 @@ class AgentConfigLoader:
             formats_path = os.path.join(common_dir, "communication_formats.yaml")
             
             if os.path.exists(formats_path):
-                with open(formats_path, 'r', encoding='utf-8') as f:
-                    formats_data = yaml.safe_load(f)
+                formats_data = _load_config_file(formats_path)
                 
                 # Store communication format instructions
                 self._communication_formats = {
@@ -89,8 +160,7 @@ class AgentConfigLoader:
             use_cases_path = os.path.join(common_dir, "use_cases.yaml")
             
             if os.path.exists(use_cases_path):
-                with open(use_cases_path, 'r', encoding='utf-8') as f:
-                    use_cases_data = yaml.safe_load(f)
+                use_cases_data = _load_config_file(use_cases_path)
                 
                 # Store use cases
                 self._use_cases = use_cases_data.get('use_cases', {})
@@ -114,25 +184,54 @@ class AgentConfigLoader:
 
     def _load_schema(self):
         """Load the JSON schema for individual agent validation."""
+        self._individual_schema = None
+        self._schema_validator = None
+        self._compiled_validator = None
+        self._schema_digest = b""
+        self._schema_error = None
+        
         try:
             if os.path.exists(self.individual_schema_path):
-                with open(self.individual_schema_path, 'r', encoding='utf-8') as f:
-                    self._individual_schema = json.load(f)
-                self.logger.info("Individual agent schema loaded successfully", schema_path=self.individual_schema_path)
+                with open(self.individual_schema_path, 'rb') as f:
+                    schema_bytes = f.read()
+                schema = json.loads(schema_bytes)
             else:
                 self.logger.warning("Individual agent schema not found, skipping validation", 
                                   schema_path=self.individual_schema_path)
+                return
         except Exception as e:
             self.logger.error("Failed to load individual agent schema", 
                             schema_path=self.individual_schema_path, error=str(e))
-            self._individual_schema = None
+            return
+        
+        self._individual_schema = schema
+        # Cached agent configs are only valid for the schema they were checked against
+        self._schema_digest = hashlib.sha256(schema_bytes).digest()
+        
+        try:
+            if HAS_FASTJSONSCHEMA:
+                # Compile the schema once into a specialized validation function
+                self._compiled_validator = fastjsonschema.compile(schema)
+            elif HAS_JSONSCHEMA:
+                # Check the schema itself once and keep a validator for every agent file
+                validator_class = validator_for(schema, default=Draft7Validator)
+                validator_class.check_schema(schema)
+                self._schema_validator = validator_class(schema)
+        except Exception as e:
+            # A broken schema must reject every agent rather than skip validation
+            self._schema_error = str(e)
+            self.logger.error("Invalid individual agent schema", 
+                            schema_path=self.individual_schema_path, error=self._schema_error)
+            return
+        
+        self.logger.info("Individual agent schema loaded successfully", schema_path=self.individual_schema_path)
     
     def _load_config(self) -> None:
-        """Load the agent configurations from individual YAML files with optional schema validation."""
-        self._load_individual_agent_files()
+        """Discover the agent configuration files; each one is parsed and validated on first access."""
+        self._discover_individual_agent_files()
     
-    def _load_individual_agent_files(self) -> None:
-        """Load agent configurations from individual YAML files."""
+    def _discover_individual_agent_files(self) -> None:
+        """Locate the individual config file of every active agent without parsing it."""
         try:
             # Resolve relative paths from the project root
             if not os.path.isabs(self.config_directory):
@@ -151,48 +250,38 @@ class AgentConfigLoader:
                 self.logger.warning("No active agents specified in configuration")
                 return
             
-            self.logger.info(f"Loading active agents: {active_agent_ids}")
+            self.logger.info(f"Discovering active agents: {active_agent_ids}")
+            
+            # Scan the directory once instead of probing each agent file separately
+            with os.scandir(config_dir) as it:
+                entries = {entry.name: entry for entry in it
+                           if entry.name.endswith(_AGENT_FILE_EXTENSIONS) and entry.is_file()}
             
-            # Load each active agent's configuration file
             for agent_id in active_agent_ids:
-                agent_file_path = os.path.join(config_dir, f"{agent_id}.yaml")
+                # Prefer a .json file, then fall back to .yaml and .yml
+                candidate_names = [f"{agent_id}{ext}" for ext in _AGENT_FILE_EXTENSIONS]
+                found = [entries[name] for name in candidate_names if name in entries]
                 
-                # Try .yml extension if .yaml doesn't exist
-                if not os.path.exists(agent_file_path):
-                    agent_file_path = os.path.join(config_dir, f"{agent_id}.yml")
-                
-                if not os.path.exists(agent_file_path):
-                    self.logger.error(f"Agent configuration file not found for '{agent_id}': {agent_file_path}")
+                if not found:
+                    self.logger.error(f"Agent configuration file not found for '{agent_id}'",
+                                    config_directory=config_dir,
+                                    candidates=candidate_names)
                     continue
                 
-                try:
-                    with open(agent_file_path, 'r', encoding='utf-8') as f:
-                        agent_data = yaml.safe_load(f)
-                    
-                    # Validate individual agent configuration
-                    self._validate_individual_agent_config(agent_data, agent_id)
-                    
-                    # Create FileBasedAgentConfig instance with communication formats and use cases
-                    self._agent_configs[agent_id] = FileBasedAgentConfig(
-                        agent_id=agent_id,
-                        config_data=agent_data,
-                        default_model_settings=agent_data.get('model_settings', {}),
-                        communication_formats=self._communication_formats,
-                        use_cases=self._use_cases
-                    )
-                    
-                    self.logger.debug(f"Loaded agent configuration for '{agent_id}'", 
-                                   config_file=agent_file_path)
-                    
-                except Exception as e:
-                    self.logger.error(f"Failed to load agent '{agent_id}' configuration", 
-                                    config_file=agent_file_path, error=str(e))
-                    continue
+                entry = found[0]
+                if len(found) > 1:
+                    # A stale generated file would otherwise silently mask edits to the others
+                    self.logger.warning(f"Multiple configuration files found for agent '{agent_id}', using {entry.name}",
+                                      config_directory=config_dir,
+                                      used=entry.name,
+                                      ignored=[other.name for other in found[1:]])
+                
+                self._agent_paths[agent_id] = entry.path
             
             self.logger.info(
-                "Individual agent configurations loaded successfully",
+                "Individual agent configuration files discovered successfully",
                 config_directory=config_dir,
-                agent_count=len(self._agent_configs),
+                agent_count=len(self._agent_paths),
                 active_agents=active_agent_ids
             )
             
@@ -204,17 +293,154 @@ class AgentConfigLoader:
             )
             raise
 
+    def _load_agent_config(self, agent_id: str) -> Optional['FileBasedAgentConfig']:
+        """Parse and validate an agent's configuration file, once, on first access."""
+        if agent_id in self._agent_configs:
+            return self._agent_configs[agent_id]
+        
+        agent_file_path = self._agent_paths.get(agent_id)
+        if agent_file_path is None or agent_id in self._failed_agents:
+            return None
+        
+        try:
+            agent_data = self._load_validated_agent_data(agent_id, agent_file_path)
+            
+            # Create FileBasedAgentConfig instance with communication formats and use cases
+            config = FileBasedAgentConfig(
+                agent_id=agent_id,
+                config_data=agent_data,
+                default_model_settings=agent_data.get('model_settings', {}),
+                communication_formats=self._communication_formats,
+                use_cases=self._use_cases
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to load agent '{agent_id}' configuration", 
+                            config_file=agent_file_path, error=str(e))
+            self._failed_agents.add(agent_id)
+            return None
+        
+        self._agent_configs[agent_id] = config
+        self.logger.debug(f"Loaded agent configuration for '{agent_id}'", 
+                       config_file=agent_file_path)
+        return config
+
+    def _load_validated_agent_data(self, agent_id: str, agent_file_path: str) -> Dict[str, Any]:
+        """Load an agent file and validate it, using the on-disk cache when enabled."""
+        if self._cache_directory is None:
+            agent_data = _load_config_file(agent_file_path)
+            self._validate_individual_agent_config(agent_data, agent_id)
+            return agent_data
+        
+        with open(agent_file_path, 'rb') as f:
+            raw = f.read()
+        digest = hashlib.sha256(self._schema_digest + raw).hexdigest()
+        cache_path = os.path.join(self._cache_directory, f"{agent_id}.{digest}.json")
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                return orjson.loads(f.read())
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable cached configuration for agent '{agent_id}'", 
+                              cache_file=cache_path, error=str(e))
+        
+        if agent_file_path.endswith('.json'):
+            agent_data = json.loads(raw)
+        else:
+            agent_data = yaml.load(raw, Loader=YamlLoader)
+        self._validate_individual_agent_config(agent_data, agent_id)
+        
+        # Write to a temporary file first so readers never see a partial cache entry
+        temp_path = None
+        try:
+            os.makedirs(self._cache_directory, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=self._cache_directory, suffix='.tmp', delete=False) as f:
+                temp_path = f.name
+                # Dates and other YAML-only types would not round-trip through JSON, so refuse them
+                f.write(orjson.dumps(agent_data, option=orjson.OPT_PASSTHROUGH_DATETIME))
+            os.replace(temp_path, cache_path)
+        except (OSError, TypeError) as e:
+            self.logger.warning(f"Failed to cache configuration for agent '{agent_id}'", 
+                              cache_file=cache_path, error=str(e))
+            if temp_path is not None:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+            return agent_data
+        
+        self._remove_stale_cache_entries(agent_id, cache_path)
+        return agent_data
+
+    def _remove_stale_cache_entries(self, agent_id: str, current_path: str) -> None:
+        """Delete cache entries of an agent other than the current one."""
+        pattern = re.compile(rf"{re.escape(agent_id)}\.[0-9a-f]{{64}}\.json")
+        current_name = os.path.basename(current_path)
+        try:
+            with os.scandir(self._cache_directory) as it:
+                stale = [entry.path for entry in it
+                         if entry.name != current_name and pattern.fullmatch(entry.name)]
+            for path in stale:
+                os.unlink(path)
+        except OSError as e:
+            self.logger.warning(f"Failed to remove stale cached configurations for agent '{agent_id}'", 
+                              cache_directory=self._cache_directory, error=str(e))
+
+    def _load_all_agent_configs(self) -> None:
+        """Parse and validate every discovered agent configuration not loaded yet."""
+        pending = [agent_id for agent_id in self._agent_paths
+                   if agent_id not in self._agent_configs and agent_id not in self._failed_agents]
+        
+        # File reads and the C parsers overlap well across threads, but the
+        # pool only pays for itself beyond a handful of files
+        if len(pending) > _PARALLEL_LOAD_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=min(_MAX_LOAD_WORKERS, len(pending))) as executor:
+                list(executor.map(self._load_agent_config, pending))
+        else:
+            for agent_id in pending:
+                self._load_agent_config(agent_id)
+
     def _validate_individual_agent_config(self, agent_data: Dict[str, Any], agent_id: str) -> None:
         """Validate an individual agent configuration against the schema."""
-        if not self._individual_schema or not HAS_JSONSCHEMA:
-            if not HAS_JSONSCHEMA:
+        if self._schema_error is not None:
+            self.logger.error(f"Individual agent configuration validation failed for '{agent_id}'", 
+                            validation_error=self._schema_error, path=None)
+            raise ValueError(f"Individual agent configuration validation failed for '{agent_id}': "
+                             f"invalid agent schema: {self._schema_error}")
+        
+        if not self._individual_schema or not (HAS_FASTJSONSCHEMA or HAS_JSONSCHEMA):
+            if not (HAS_FASTJSONSCHEMA or HAS_JSONSCHEMA):
                 self.logger.warning("jsonschema not available, skipping individual agent validation")
             else:
                 self.logger.info("No individual agent schema loaded, skipping validation")
             return
         
+        # Most broken configs miss a required top-level key, which needs no schema walk to detect
+        if isinstance(agent_data, dict):
+            missing_field = next((field for field in self._individual_schema.get('required', [])
+                                  if field not in agent_data), None)
+            if missing_field is not None:
+                message = f"'{missing_field}' is a required property"
+                self.logger.error(f"Individual agent configuration validation failed for '{agent_id}'", 
+                                validation_error=message, path=None)
+                raise ValueError(f"Individual agent configuration validation failed for '{agent_id}': {message}")
+        
+        if self._compiled_validator is not None:
+            try:
+                self._compiled_validator(agent_data)
+            except fastjsonschema.JsonSchemaValueException as e:
+                self.logger.error(f"Individual agent configuration validation failed for '{agent_id}'", 
+                                validation_error=e.message,
+                                path=e.path[1:] or None)
+                raise ValueError(f"Individual agent configuration validation failed for '{agent_id}': {e.message}")
+            self.logger.debug(f"Individual agent configuration validation passed for '{agent_id}'")
+            return
+        
         try:
-            validate(instance=agent_data, schema=self._individual_schema)
+            error = best_match(self._schema_validator.iter_errors(agent_data))
+            if error is not None:
+                raise error
             self.logger.debug(f"Individual agent configuration validation passed for '{agent_id}'")
         except ValidationError as e:
             self.logger.error(f"Individual agent configuration validation failed for '{agent_id}'", 
@@ -226,27 +452,44 @@ class AgentConfigLoader:
             raise
 
     def get_config(self, agent_id: str) -> Optional['FileBasedAgentConfig']:
-        """Get the configuration for a specific agent."""
-        return self._agent_configs.get(agent_id)
+        """Get the configuration for a specific agent, loading it on first access."""
+        return self._load_agent_config(agent_id)
 
     def get_all_configs(self) -> Dict[str, 'FileBasedAgentConfig']:
-        """Get all loaded agent configurations."""
-        return self._agent_configs.copy()
+        """Get all valid agent configurations, in active agent order."""
+        self._load_all_agent_configs()
+        return {agent_id: self._agent_configs[agent_id]
+                for agent_id in self._agent_paths if agent_id in self._agent_configs}
 
     def list_agent_ids(self) -> List[str]:
-        """Get a list of all loaded agent IDs."""
-        return list(self._agent_configs.keys())
+        """Get a list of all agent IDs with a valid configuration."""
+        return list(self.get_all_configs().keys())
 
     def reload_config(self) -> None:
         """Reload all agent configurations from files."""
+        self._agent_paths.clear()
         self._agent_configs.clear()
+        self._failed_agents.clear()
         self._load_schema()
         self._load_config()
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached config parses so the next load reads every file from disk."""
+        _CONFIG_CACHE.clear()
+
 
 class FileBasedAgentConfig:
-    """Configuration for a single agent loaded from a YAML file."""
-    
+    """Configuration for a single agent loaded from a YAML or JSON file."""
+
+    __slots__ = (
+        'logger', 'agent_id', 'config_data', 'default_model_settings', 'communication_formats', 'use_cases',
+        '_system_prompt_template', '_system_prompt_variables', '_tools', '_voice_settings',
+        '_agent_use_cases', '_model_settings', '_system_prompt',
+    )
+
+    _REQUIRED = ('id', 'name', 'description')
+
     def __init__(self, agent_id: str, config_data: Dict[str, Any], default_model_settings: Dict[str, Any],
                  communication_formats: Optional[Dict[str, str]] = None, use_cases: Optional[Dict[str, Dict[str, Any]]] = None):
         """
@@ -268,15 +511,30 @@ class FileBasedAgentConfig:
         self.communication_formats = communication_formats or {}
         self.use_cases = use_cases or {}
         
-        # Validate required fields
-        required_fields = ['id', 'name', 'description']
-        for field in required_fields:
-            if field not in config_data:
-                raise ValueError(f"Missing required field '{field}' in agent configuration for {agent_id}")
+        # Validate required fields, reporting the first one missing
+        missing_field = next((field for field in self._REQUIRED if field not in config_data), None)
+        if missing_field is not None:
+            raise ValueError(f"Missing required field '{missing_field}' in agent configuration for {agent_id}")
+
+        # Extract per-agent values once so the getters are plain attribute reads
+        self._system_prompt_template = config_data.get('system_prompt_template', '')
+        self._system_prompt_variables = config_data.get('system_prompt_variables', None)
+        self._tools = config_data.get('tools', [])
+        self._voice_settings = config_data.get('voice_settings', {})
+        self._agent_use_cases = config_data.get('use_cases', [])
+        # Merge with defaults, agent-specific settings take precedence
+        self._model_settings = {**self.default_model_settings, **config_data.get('model_settings', {})}
+        self._system_prompt: Optional[str] = None
 
     def get_system_prompt(self) -> str:
-        """Get the system prompt template for the agent."""
-        base_prompt = self.config_data.get('system_prompt_template', '')
+        """Get the system prompt for the agent, built on first access."""
+        if self._system_prompt is None:
+            self._system_prompt = self._build_system_prompt()
+        return self._system_prompt
+
+    def _build_system_prompt(self) -> str:
+        """Compose the prompt template with use case and formatting sections."""
+        base_prompt = self._system_prompt_template
         
         # Add use case descriptions if available
         agent_use_cases = self.get_use_cases()
@@ -326,27 +584,24 @@ class FileBasedAgentConfig:
     
     def get_system_prompt_variables(self) -> Optional[Dict[str, Any]]:
         """Get the system prompt variables for the agent."""
-        return self.config_data.get('system_prompt_variables', None)
+        return self._system_prompt_variables
 
 
     def get_tools(self) -> List[str]:
         """Get the list of available tools for the agent."""
-        return self.config_data.get('tools', [])
+        return self._tools
 
     def get_voice_settings(self) -> Dict[str, str]:
         """Get voice settings for the agent."""
-        return self.config_data.get('voice_settings', {})
+        return self._voice_settings
 
     def get_use_cases(self) -> List[str]:
         """Get the list of use cases for the agent."""
-        return self.config_data.get('use_cases', [])
+        return self._agent_use_cases
 
     def get_model_settings(self) -> Dict[str, Any]:
         """Get model settings for the agent, with fallback to defaults."""
-        agent_model_settings = self.config_data.get('model_settings', {})
-        # Merge with defaults, agent-specific settings take precedence
-        merged_settings = {**self.default_model_settings, **agent_model_settings}
-        return merged_settings
+        return dict(self._model_settings)
 
 
 class FileBasedGRCAgentConfigRegistry:
@@ -0,0 +1,57 @@
+"""
+ASGI interceptor that answers health probes before the FastAPI application.
+
+Load balancer and orchestrator probes hit the health endpoints every few seconds.
+Answering their GET/HEAD requests here skips routing, middleware and response
+encoding entirely. Every other request, including browser requests that need
+CORS handling, is passed through to the wrapped application unchanged.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, MutableMapping
+
+from .routes.health import HEALTH_PREFIX, HEALTH_STATUS, cached_health_body, health_body, health_cache_headers
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+# Full request path -> health endpoint relative to the health router prefix
+HEALTH_PATHS: Dict[str, str] = {f"{HEALTH_PREFIX}{endpoint}": endpoint for endpoint in HEALTH_STATUS}
+
+_SHORT_CIRCUIT_METHODS = frozenset({"GET", "HEAD"})
+
+
+class HealthCheckInterceptor:
+    """Serve the health endpoints directly and delegate everything else to the wrapped app."""
+
+    def __init__(self, app: ASGIApp):
+        """
+        Wrap an ASGI application.
+
+        Args:
+            app: Application that handles every request other than a health probe
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (scope["type"] != "http" or scope["path"] not in HEALTH_PATHS
+                or scope["method"] not in _SHORT_CIRCUIT_METHODS
+                # Cross-origin requests need the CORS middleware; probes never send Origin
+                or any(name == b"origin" for name, _ in scope["headers"])):
+            await self.app(scope, receive, send)
+            return
+
+        headers = [(b"content-type", b"application/json")]
+        endpoint = HEALTH_PATHS[scope["path"]]
+        if endpoint == "/":
+            body, hit = cached_health_body()
+            headers.extend((name.lower().encode("latin-1"), value.encode("latin-1"))
+                           for name, value in health_cache_headers(hit).items())
+        else:
+            body = health_body(endpoint)
+
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": b"" if scope["method"] == "HEAD" else body})
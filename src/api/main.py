@@ -7,10 +7,12 @@ import structlog
 from contextlib import asynccontextmanager
 from typing import Dict, Any
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
+from .health_interceptor import HealthCheckInterceptor
+from .responses import ORJSONResponse
 from .routes import agents, health, chat
 from ..utils.settings import settings
 
@@ -61,17 +63,18 @@ async def lifespan(app: FastAPI):
 
 
 # Create FastAPI app
-app = FastAPI(
+fastapi_app = FastAPI(
     title="GRC Agent Squad API",
     description="AI agent squad specialized for Governance, Risk Management, and Compliance (GRC) industry applications",
     version="1.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc"
 )
 
 # Configure CORS
-app.add_middleware(
+fastapi_app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # Configure appropriately for production
     allow_credentials=True,
@@ -80,7 +83,7 @@ app.add_middleware(
 )
 
 # Define API routes first
-@app.get("/api/info")
+@fastapi_app.get("/api/info")
 async def get_api_info() -> Dict[str, Any]:
     """Get API information and status."""
     
@@ -114,26 +117,26 @@ async def get_api_info() -> Dict[str, Any]:
 
 
 # Include routers
-app.include_router(health.router, prefix="/health", tags=["health"])
-app.include_router(agents.router, prefix="/api/agents", tags=["agents"])
-app.include_router(chat.router, prefix="/api/chat", tags=["chat"])
+fastapi_app.include_router(health.router, prefix=health.HEALTH_PREFIX, tags=["health"])
+fastapi_app.include_router(agents.router, prefix="/api/agents", tags=["agents"])
+fastapi_app.include_router(chat.router, prefix="/api/chat", tags=["chat"])
 
 # Add convenience endpoints (without trailing slash) that redirect to canonical versions
-@app.get("/health")
+@fastapi_app.get(health.HEALTH_PREFIX)
 async def health_redirect():
     """Redirect to canonical health endpoint with trailing slash."""
     from fastapi import Response
     from fastapi.responses import RedirectResponse
-    return RedirectResponse(url="/health/", status_code=301)
+    return RedirectResponse(url=f"{health.HEALTH_PREFIX}/", status_code=301)
 
-@app.get("/api/agents")
+@fastapi_app.get("/api/agents")
 async def agents_redirect():
     """Redirect to canonical agents endpoint with trailing slash."""
     from fastapi import Response
     from fastapi.responses import RedirectResponse
     return RedirectResponse(url="/api/agents/", status_code=301)
 
-@app.get("/api/chat")
+@fastapi_app.get("/api/chat")
 async def chat_redirect():
     """Redirect to canonical chat endpoint with trailing slash."""
     from fastapi import Response
@@ -141,8 +144,28 @@ async def chat_redirect():
     return RedirectResponse(url="/api/chat/", status_code=301)
 
 
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that adds a Cache-Control header; Starlette already handles ETag and 304 responses."""
+    
+    def __init__(self, *args: Any, cache_control: str, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.cache_control = cache_control
+    
+    def file_response(self, *args: Any, **kwargs: Any) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = self.cache_control
+        return response
+
+
 # Mount static files (must come last to avoid overriding API routes)
 try:
-    app.mount("/", StaticFiles(directory="src/static", html=True), name="static")
+    fastapi_app.mount(
+        "/",
+        CachedStaticFiles(directory="src/static", html=True, cache_control="public, max-age=300"),
+        name="static"
+    )
 except Exception as e:
-    logger.warning("Failed to mount static files", error=str(e)) 
\ No newline at end of file
+    logger.warning("Failed to mount static files", error=str(e))
+
+# Health probes are answered ahead of the middleware stack; this is the ASGI entry point
+app = HealthCheckInterceptor(fastapi_app)
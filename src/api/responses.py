@@ -0,0 +1,19 @@
+"""
+Response classes for the GRC Agent Squad API.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson, which emits bytes directly and is much faster than json.
+
+    Defined here rather than imported from fastapi.responses, where the class is deprecated
+    in recent FastAPI releases and warns on every response.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
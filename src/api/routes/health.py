@@ -4,40 +4,101 @@ Health check endpoints for the GRC Agent Squad API.
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timezone
+from typing import Any, Dict, Tuple
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Response
+
+from ...utils.settings import settings
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Mount point of this router, shared with the ASGI health interceptor
+HEALTH_PREFIX = "/health"
 
-@router.get("/")
-async def root():
-    """Root endpoint returning basic service information."""
-    return {
+# Static part of each health response, keyed by path relative to the router prefix.
+# Shared with the ASGI health interceptor so both paths report the same status.
+HEALTH_STATUS: Dict[str, Dict[str, str]] = {
+    "/": {
         "service": "GRC Agent Squad",
         "status": "running",
         "message": "GRC Agent Squad is running",
-        "timestamp": datetime.now(timezone.utc).isoformat()
+    },
+    "/ready": {
+        "status": "ready",
+        "message": "GRC Agent Squad is ready to serve requests",
+    },
+    "/live": {
+        "status": "alive",
+        "message": "GRC Agent Squad is alive",
+    },
+}
+
+
+# Stand-in serialized in place of the timestamp when building the body templates
+_TIMESTAMP_PLACEHOLDER = "__timestamp__"
+
+
+def _body_template(endpoint: str) -> Tuple[bytes, bytes]:
+    """Serialize an endpoint's response once, split around the timestamp value."""
+    body = orjson.dumps({**HEALTH_STATUS[endpoint], "timestamp": _TIMESTAMP_PLACEHOLDER})
+    prefix, suffix = body.split(_TIMESTAMP_PLACEHOLDER.encode("ascii"))
+    return prefix, suffix
+
+
+# Pre-serialized bodies per endpoint; only the timestamp is filled in per request
+_BODY_TEMPLATES: Dict[str, Tuple[bytes, bytes]] = {endpoint: _body_template(endpoint) for endpoint in HEALTH_STATUS}
+
+
+def health_body(endpoint: str) -> bytes:
+    """Get the JSON body of the health response for an endpoint, stamped with the current time."""
+    prefix, suffix = _BODY_TEMPLATES[endpoint]
+    timestamp = datetime.now(timezone.utc).isoformat(timespec="microseconds").encode("ascii")
+    return prefix + timestamp + suffix
+
+
+# Last /health/ body and the monotonic time it stops being served
+_health_cache: Dict[str, Any] = {"body": None, "expires": 0.0}
+
+
+def cached_health_body() -> Tuple[bytes, bool]:
+    """Get the /health/ body, reused for up to health_cache_ttl seconds; the flag is True on a cache hit."""
+    now = time.monotonic()
+    if _health_cache["body"] is not None and now < _health_cache["expires"]:
+        return _health_cache["body"], True
+    
+    body = health_body("/")
+    _health_cache["body"] = body
+    _health_cache["expires"] = now + settings.health_cache_ttl
+    return body, False
+
+
+def health_cache_headers(hit: bool) -> Dict[str, str]:
+    """Build the caching headers sent with a /health/ response."""
+    return {
+        "X-Cache": "HIT" if hit else "MISS",
+        "Cache-Control": f"max-age={int(settings.health_cache_ttl)}",
     }
 
 
+# Handlers return pre-serialized responses, skipping FastAPI's encoding of returned dicts
+@router.get("/")
+async def root():
+    """Root endpoint returning basic service information."""
+    body, hit = cached_health_body()
+    return Response(content=body, media_type="application/json", headers=health_cache_headers(hit))
+
+
 @router.get("/ready")
 async def readiness_check():
     """Readiness check endpoint."""
-    return {
-        "status": "ready",
-        "message": "GRC Agent Squad is ready to serve requests",
-        "timestamp": datetime.now(timezone.utc).isoformat()
-    }
+    return Response(content=health_body("/ready"), media_type="application/json")
 
 
 @router.get("/live")
 async def liveness_check():
     """Liveness check endpoint."""
-    return {
-        "status": "alive",
-        "message": "GRC Agent Squad is alive",
-        "timestamp": datetime.now(timezone.utc).isoformat()
-    } 
\ No newline at end of file
+    return Response(content=health_body("/live"), media_type="application/json")
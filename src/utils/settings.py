@@ -6,10 +6,11 @@ All important parameters can be overwritten with environment variables and have
 """
 
 import os
-from typing import List, Optional
+from typing import Annotated, Any, List, Optional
 
-from pydantic import Field
-from pydantic_settings import BaseSettings
+import orjson
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, NoDecode
 
 
 class Settings(BaseSettings):
@@ -27,7 +28,8 @@ class Settings(BaseSettings):
         default="config/agents", 
         description="Directory containing individual agent configuration files"
     )
-    active_agents: List[str] = Field(
+    # NoDecode hands the raw environment string to the validator below instead of stdlib json
+    active_agents: Annotated[List[str], NoDecode] = Field(
         default=["supervisor_grc", 
                 "empathetic_interviewer_executive", 
                 "authoritative_compliance_executive", 
@@ -39,6 +41,10 @@ class Settings(BaseSettings):
         default="supervisor_grc",
         description="Default agent to use when no specific agent is selected"
     )
+    agent_config_cache_dir: Optional[str] = Field(
+        default=None,
+        description="Directory for cached validated agent configs (disabled when unset or in development mode)"
+    )
     
     # Hierarchical Routing Configuration
     enable_hierarchical_routing: bool = Field(
@@ -108,6 +114,10 @@ class Settings(BaseSettings):
         default="http://localhost:3000,http://localhost:8080",
         description="CORS allowed origins (comma-separated)"
     )
+    health_cache_ttl: float = Field(
+        default=30.0,
+        description="Seconds a /health/ response is reused before being rebuilt (0 disables caching)"
+    )
     
     # Logging Configuration
     log_level: str = Field(default="INFO", description="Logging level")
@@ -117,6 +127,14 @@ class Settings(BaseSettings):
     debug: bool = Field(default=False, description="Enable debug mode")
     development_mode: bool = Field(default=True, description="Enable development mode")  # Default to development
     
+    @field_validator("active_agents", mode="before")
+    @classmethod
+    def parse_active_agents(cls, value: Any) -> Any:
+        """Decode ACTIVE_AGENTS given as a JSON array string with orjson."""
+        if isinstance(value, (str, bytes)):
+            return orjson.loads(value)
+        return value
+    
     @property
     def cors_origins_list(self) -> List[str]:
         """Convert CORS origins string to list."""
@@ -0,0 +1,22 @@
+"""
+Shared fixtures for the unit tests.
+"""
+
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+from src.api.main import app, fastapi_app
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """Async HTTP client for the ASGI entry point, shared by the whole session."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def fastapi_client():
+    """Async HTTP client for the FastAPI app without the health interceptor in front."""
+    async with AsyncClient(transport=ASGITransport(app=fastapi_app), base_url="http://test") as client:
+        yield client
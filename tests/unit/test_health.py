@@ -2,55 +2,92 @@
 Unit tests for health check endpoints.
 """
 
-import pytest
-from fastapi.testclient import TestClient
-
-from src.api.main import app
+from datetime import datetime
 
-pytestmark = pytest.mark.unit
+import pytest
 
-client = TestClient(app)
+pytestmark = [pytest.mark.unit, pytest.mark.asyncio]
 
 
-def test_health_check():
-    """Test the main health check endpoint."""
-    response = client.get("/health/")
+@pytest.mark.parametrize("path, expected", [
+    ("/health/", {"service": "GRC Agent Squad", "status": "running", "message": "GRC Agent Squad is running"}),
+    ("/health/ready", {"status": "ready", "message": "GRC Agent Squad is ready to serve requests"}),
+    ("/health/live", {"status": "alive", "message": "GRC Agent Squad is alive"}),
+], ids=["health", "ready", "live"])
+async def test_health_endpoint(client, path, expected):
+    """Test the health, readiness and liveness check endpoints."""
+    response = await client.get(path)
     assert response.status_code == 200
     
     data = response.json()
-    assert data["service"] == "GRC Agent Squad"
-    assert data["status"] == "running"
-    assert data["message"] == "GRC Agent Squad is running"
-    assert "timestamp" in data
+    assert datetime.fromisoformat(data.pop("timestamp")).tzinfo is not None
+    assert data == expected
 
 
-def test_readiness_check():
-    """Test the readiness check endpoint."""
-    response = client.get("/health/ready")
-    assert response.status_code == 200
+async def test_health_check_cached(client):
+    """Test that repeated health checks within the TTL are served from the cache."""
+    first = await client.get("/health/")
+    second = await client.get("/health/")
     
-    data = response.json()
-    assert data["status"] == "ready"
-    assert data["message"] == "GRC Agent Squad is ready to serve requests"
-    assert "timestamp" in data
+    assert second.headers["x-cache"] == "HIT"
+    assert second.headers["cache-control"].startswith("max-age=")
+    assert second.content == first.content
+
+
+@pytest.mark.parametrize("path", ["/health/", "/health/ready", "/health/live"])
+async def test_health_interceptor_matches_routes(client, fastapi_client, path):
+    """Test the interceptor returns the same payload as the FastAPI health routes."""
+    # Health probes are answered by the ASGI interceptor; the FastAPI app still serves the routes
+    intercepted = (await client.get(path)).json()
+    routed = (await fastapi_client.get(path)).json()
+    
+    assert intercepted.pop("timestamp") and routed.pop("timestamp")
+    assert intercepted == routed
+
 
+async def test_health_check_method_not_allowed(client):
+    """Test that other methods on health endpoints are rejected by the application."""
+    response = await client.post("/health/")
+    assert response.status_code == 405
+    assert {method.strip() for method in response.headers["allow"].split(",")} == {"GET", "HEAD"}
 
-def test_liveness_check():
-    """Test the liveness check endpoint."""
-    response = client.get("/health/live")
+
+async def test_health_check_head(client):
+    """Test that HEAD probes get headers without a body."""
+    response = await client.head("/health/live")
     assert response.status_code == 200
+    assert int(response.headers["content-length"]) > 0
+    assert response.content == b""
+
+
+async def test_health_check_cors(client):
+    """Test that cross-origin requests to health endpoints still get CORS handling."""
+    origin = {"Origin": "http://example.com"}
     
-    data = response.json()
-    assert data["status"] == "alive"
-    assert data["message"] == "GRC Agent Squad is alive"
-    assert "timestamp" in data
+    preflight = await client.options("/health/", headers={**origin, "Access-Control-Request-Method": "GET"})
+    assert preflight.status_code == 200
+    assert "access-control-allow-origin" in preflight.headers
+    
+    response = await client.get("/health/", headers=origin)
+    assert response.status_code == 200
+    assert "access-control-allow-origin" in response.headers
 
 
-def test_root_endpoint():
+async def test_root_endpoint(client):
     """Test the root endpoint returns HTML."""
-    response = client.get("/")
+    response = await client.get("/")
     assert response.status_code == 200
     
     # Root endpoint returns HTML, not JSON
     assert "text/html" in response.headers.get("content-type", "")
-    assert "GRC Agent Squad" in response.text 
\ No newline at end of file
+    assert "GRC Agent Squad" in response.text
+
+
+async def test_root_endpoint_not_modified(client):
+    """Test the root page is revalidated with its ETag instead of being resent."""
+    response = await client.get("/")
+    assert response.headers["cache-control"] == "public, max-age=300"
+    
+    revalidated = await client.get("/", headers={"If-None-Match": response.headers["etag"]})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""